@@ -1,5 +1,7 @@
 // Game constants and configuration
 
+use rand::Rng;
+
 // Game settings
 pub const MIN_PLAYERS: usize = 3;
 pub const MAX_PLAYERS: usize = 12;
@@ -552,6 +554,22 @@ pub const WORD_PAIRS: &[(&str, &str)] = &[
     ("spell", "enchantment"),
 ];
 
+// WORD_PAIRS must never be empty (checked at compile time)
+const _: () = assert!(!WORD_PAIRS.is_empty());
+
+/// Pick a random word pair
+///
+/// # Arguments
+///
+/// * `rng` - Random number generator to draw from
+///
+/// # Returns
+///
+/// A (villager_word, knight_word) tuple from WORD_PAIRS
+pub fn random_word_pair<R: Rng>(rng: &mut R) -> (&'static str, &'static str) {
+    WORD_PAIRS[rng.gen_range(0..WORD_PAIRS.len())]
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -566,4 +584,12 @@ mod tests {
         assert_eq!(MIN_PLAYERS, 3);
         assert_eq!(MAX_PLAYERS, 12);
     }
+
+    #[test]
+    fn test_random_word_pair() {
+        let mut rng = rand::thread_rng();
+        let pair = random_word_pair(&mut rng);
+
+        assert!(WORD_PAIRS.contains(&pair));
+    }
 }
@@ -1,6 +1,8 @@
 use rand::{distributions::Alphanumeric, Rng};
-use std::collections::HashMap;
+use std::collections::{hash_map::Entry, HashMap};
+use std::sync::Arc;
 use time::{Duration, OffsetDateTime};
+use tokio::sync::RwLock;
 
 use super::{GameSession, GameState, FINISHED_GAME_TTL_SECONDS, GAME_TTL_SECONDS};
 
@@ -25,17 +27,30 @@ impl GameManager {
     ///
     /// The game_id of the newly created game
     pub fn create_game(&mut self) -> String {
-        // Generate a unique, URL-safe game ID (8 characters)
-        // Using 6 bytes of random data encoded as base64url gives ~8 chars
-        let mut game_id = Self::generate_game_id();
-
-        // Ensure uniqueness (very unlikely to collide, but check anyway)
-        while self.games.contains_key(&game_id) {
-            game_id = Self::generate_game_id();
+        loop {
+            let game_id = Self::generate_game_id();
+
+            // Collisions are practically impossible (~71 bits of entropy), so
+            // the uniqueness check and the insert share a single hash lookup
+            if let Entry::Vacant(entry) = self.games.entry(game_id.clone()) {
+                entry.insert(GameSession::new(game_id.clone()));
+                return game_id;
+            }
         }
+    }
 
-        let game = GameSession::new(game_id.clone());
-        self.games.insert(game_id.clone(), game);
+    /// Create a new game session and schedule its removal at expiry
+    ///
+    /// # Arguments
+    ///
+    /// * `manager` - Shared handle to this manager, used by the expiry task
+    ///
+    /// # Returns
+    ///
+    /// The game_id of the newly created game
+    pub fn create_scheduled_game(&mut self, manager: &Arc<RwLock<GameManager>>) -> String {
+        let game_id = self.create_game();
+        self.schedule_expiry(manager, &game_id);
         game_id
     }
 
@@ -85,7 +100,79 @@ impl GameManager {
     ///
     /// * `game_id` - The game's unique identifier
     pub fn remove_game(&mut self, game_id: &str) {
-        self.games.remove(game_id);
+        if let Some(game) = self.games.remove(game_id) {
+            if let Some(task) = game.expiry_task {
+                task.abort();
+            }
+        }
+    }
+
+    /// Calculate when a game becomes stale
+    ///
+    /// Unfinished games expire `GAME_TTL_SECONDS` after creation, finished
+    /// games expire `FINISHED_GAME_TTL_SECONDS` after finishing (whichever
+    /// comes first).
+    fn expires_at(game: &GameSession) -> OffsetDateTime {
+        let ttl_expiry = game.created_at + Duration::seconds(GAME_TTL_SECONDS as i64);
+
+        match game.finished_at {
+            Some(finished_at) if game.state == GameState::Finished => {
+                ttl_expiry.min(finished_at + Duration::seconds(FINISHED_GAME_TTL_SECONDS as i64))
+            }
+            _ => ttl_expiry,
+        }
+    }
+
+    /// Schedule removal of a game at its expiry time
+    ///
+    /// Spawns a task that sleeps until the game expires and then removes it.
+    /// This is the only thing that expires games in production. Any previously
+    /// scheduled task for the game is cancelled, so call this again whenever
+    /// the game's expiry changes (e.g. after it finishes).
+    ///
+    /// # Arguments
+    ///
+    /// * `manager` - Shared handle to this manager, used by the spawned task
+    /// * `game_id` - The game's unique identifier
+    pub fn schedule_expiry(&mut self, manager: &Arc<RwLock<GameManager>>, game_id: &str) {
+        let Some(game) = self.games.get_mut(game_id) else {
+            return;
+        };
+
+        let delay: std::time::Duration = (Self::expires_at(game) - OffsetDateTime::now_utc())
+            .try_into()
+            .unwrap_or_default();
+        let manager = Arc::clone(manager);
+        let expired_game_id = game_id.to_string();
+
+        let task = tokio::spawn(async move {
+            // Skip the timer for games that are already expired
+            if !delay.is_zero() {
+                tokio::time::sleep(delay).await;
+            }
+            manager.write().await.expire_game(&expired_game_id);
+        });
+
+        if let Some(previous) = game.expiry_task.replace(task.abort_handle()) {
+            previous.abort();
+        }
+    }
+
+    /// Remove a game if it has expired
+    ///
+    /// # Arguments
+    ///
+    /// * `game_id` - The game's unique identifier
+    fn expire_game(&mut self, game_id: &str) {
+        let expired = self
+            .games
+            .get(game_id)
+            .is_some_and(|game| Self::expires_at(game) <= OffsetDateTime::now_utc());
+
+        if expired {
+            tracing::info!("Removing expired game {}", game_id);
+            self.remove_game(game_id);
+        }
     }
 
     /// Remove games that are too old or finished
@@ -95,36 +182,21 @@ impl GameManager {
     /// Number of games cleaned up
     pub fn cleanup_stale_games(&mut self) -> usize {
         let now = OffsetDateTime::now_utc();
-        let cutoff_time = now - Duration::seconds(GAME_TTL_SECONDS as i64);
-        let finished_cutoff = now - Duration::seconds(FINISHED_GAME_TTL_SECONDS as i64);
+        let before = self.games.len();
 
-        let stale_game_ids: Vec<String> = self
-            .games
-            .iter()
-            .filter_map(|(game_id, game)| {
-                // Remove old unfinished games (after 1 hour)
-                if game.created_at < cutoff_time {
-                    return Some(game_id.clone());
-                }
-
-                // Remove finished games (after 30 minutes)
-                if game.state == GameState::Finished {
-                    if let Some(finished_at) = game.finished_at {
-                        if finished_at < finished_cutoff {
-                            return Some(game_id.clone());
-                        }
-                    }
-                }
-
-                None
-            })
-            .collect();
-
-        for game_id in &stale_game_ids {
-            self.remove_game(game_id);
-        }
+        // Filter in place rather than collecting stale IDs for a second pass
+        self.games.retain(|_, game| {
+            if Self::expires_at(game) > now {
+                return true;
+            }
+
+            if let Some(task) = game.expiry_task.take() {
+                task.abort();
+            }
+            false
+        });
 
-        stale_game_ids.len()
+        before - self.games.len()
     }
 
     /// Get statistics about active games
@@ -133,12 +205,16 @@ impl GameManager {
     ///
     /// JSON value with game statistics
     pub fn get_stats(&self) -> serde_json::Value {
-        let total_players: usize = self.games.values().map(|game| game.players.len()).sum();
-        let active_games = self
-            .games
-            .values()
-            .filter(|game| game.state != GameState::Finished)
-            .count();
+        // Single pass; players.len() is O(1), so this is O(games)
+        let (active_games, total_players) =
+            self.games
+                .values()
+                .fold((0, 0), |(active_games, total_players), game| {
+                    (
+                        active_games + usize::from(game.state != GameState::Finished),
+                        total_players + game.players.len(),
+                    )
+                });
 
         serde_json::json!({
             "total_games": self.games.len(),
@@ -318,4 +394,31 @@ mod tests {
         assert_eq!(cleaned, 0);
         assert!(manager.get_game(&game_id).is_some());
     }
+
+    #[tokio::test]
+    async fn test_scheduled_expiry_removes_game() {
+        let manager = Arc::new(RwLock::new(GameManager::new()));
+
+        let game_id = {
+            let mut guard = manager.write().await;
+            let game_id = guard.create_scheduled_game(&manager);
+            if let Some(game) = guard.get_game_mut(&game_id) {
+                game.created_at = OffsetDateTime::now_utc() - Duration::hours(2);
+            }
+            guard.schedule_expiry(&manager, &game_id);
+            game_id
+        };
+
+        // Already expired, so the task only needs a few turns of the runtime
+        let mut removed = false;
+        for _ in 0..100 {
+            if manager.read().await.get_game(&game_id).is_none() {
+                removed = true;
+                break;
+            }
+            tokio::task::yield_now().await;
+        }
+
+        assert!(removed);
+    }
 }
@@ -1,14 +1,16 @@
 use rand::seq::SliceRandom;
 use rand::thread_rng;
-use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
+use serde::{Deserialize, Serialize, Serializer};
+use std::collections::{HashMap, HashSet};
+use std::sync::Arc;
 use time::OffsetDateTime;
 use tokio::sync::broadcast;
+use tokio::task::AbortHandle;
 
-use super::{assign_roles, Player, MIN_PLAYERS, WORD_PAIRS};
+use super::{assign_roles, random_word_pair, Player, Role, MIN_PLAYERS};
 
 /// Game state enum
-#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 #[serde(rename_all = "lowercase")]
 pub enum GameState {
     Lobby,
@@ -18,6 +20,90 @@ pub enum GameState {
     Finished,
 }
 
+impl GameState {
+    /// Get the string representation of the state, as serialized
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            GameState::Lobby => "lobby",
+            GameState::Playing => "playing",
+            GameState::Voting => "voting",
+            GameState::DragonGuess => "dragonguess",
+            GameState::Finished => "finished",
+        }
+    }
+}
+
+/// Game state as seen by a single player
+///
+/// Borrows from the GameSession so it serializes straight to JSON without
+/// cloning every field into an intermediate `serde_json::Value`.
+#[derive(Debug, Serialize)]
+pub struct PlayerStateView<'a> {
+    pub game_id: &'a str,
+    pub state: GameState,
+    pub your_id: &'a str,
+    pub your_role: Option<&'a str>,
+    pub your_word: Option<&'a str>,
+    pub is_host: bool,
+    pub is_alive: bool,
+    pub players: PlayerList<'a>,
+    pub player_count: usize,
+    pub alive_count: usize,
+    pub can_start: bool,
+    pub votes_submitted: usize,
+    pub has_voted: bool,
+    pub last_elimination: Option<&'a serde_json::Value>,
+    pub player_order: &'a [String],
+    pub voting_timer_seconds: Option<u32>,
+    pub voting_started_at: Option<i64>,
+    /// Only present once the game is finished
+    #[serde(flatten)]
+    pub results: Option<ResultsView<'a>>,
+}
+
+impl PlayerStateView<'_> {
+    /// Serialize as a `state_update` WebSocket message
+    pub fn to_message(&self) -> serde_json::Result<String> {
+        #[derive(Serialize)]
+        struct StateUpdate<'v, 'a> {
+            #[serde(rename = "type")]
+            kind: &'static str,
+            data: &'v PlayerStateView<'a>,
+        }
+
+        serde_json::to_string(&StateUpdate {
+            kind: "state_update",
+            data: self,
+        })
+    }
+}
+
+/// End-of-game details revealed to all players
+#[derive(Debug, Serialize)]
+pub struct ResultsView<'a> {
+    pub winner: Option<&'a str>,
+    pub villager_word: Option<&'a str>,
+    pub knight_word: Option<&'a str>,
+    pub dragon_guess: Option<&'a str>,
+}
+
+/// Serializes a game's players as a JSON array, with roles only if requested
+#[derive(Debug)]
+pub struct PlayerList<'a> {
+    players: &'a HashMap<String, Player>,
+    include_role: bool,
+}
+
+impl Serialize for PlayerList<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.collect_seq(
+            self.players
+                .values()
+                .map(|p| p.public_view(self.include_role)),
+        )
+    }
+}
+
 /// Manages a single game session
 #[derive(Debug)]
 pub struct GameSession {
@@ -25,8 +111,12 @@ pub struct GameSession {
     pub game_id: String,
     /// Map of player ID to Player
     pub players: HashMap<String, Player>,
+    /// Lowercased nicknames of current players, for duplicate checks
+    nicknames: HashSet<String>,
     /// Current game state
     pub state: GameState,
+    /// ID of the Dragon player, set only by start_game; read through dragon()
+    dragon_id: Option<String>,
     /// Word for villagers
     pub villager_word: Option<String>,
     /// Similar word for knights
@@ -40,7 +130,11 @@ pub struct GameSession {
     /// Map of voter_id -> target_id
     pub votes: HashMap<String, String>,
     /// Broadcast channel for WebSocket updates
-    pub broadcast_tx: broadcast::Sender<String>,
+    ///
+    /// Messages are serialized once and shared as `Arc<str>`, so fanning out
+    /// to every subscriber only bumps a reference count instead of cloning
+    /// the JSON string per receiver.
+    pub broadcast_tx: broadcast::Sender<Arc<str>>,
     /// "villagers" or "dragon"
     pub winner: Option<String>,
     /// Dragon's word guess if eliminated
@@ -57,6 +151,8 @@ pub struct GameSession {
     pub voting_started_at: Option<OffsetDateTime>,
     /// ID of the rematch game created when this game finishes
     pub rematch_game_id: Option<String>,
+    /// Scheduled task that removes this game once it expires
+    pub expiry_task: Option<AbortHandle>,
 }
 
 impl GameSession {
@@ -71,7 +167,9 @@ impl GameSession {
         Self {
             game_id,
             players: HashMap::new(),
+            nicknames: HashSet::new(),
             state: GameState::Lobby,
+            dragon_id: None,
             villager_word: None,
             knight_word: None,
             created_at: OffsetDateTime::now_utc(),
@@ -87,6 +185,7 @@ impl GameSession {
             voting_timer_seconds: None,
             voting_started_at: None,
             rematch_game_id: None,
+            expiry_task: None,
         }
     }
 
@@ -102,12 +201,17 @@ impl GameSession {
     ///
     /// # Errors
     ///
-    /// Returns an error if game is not in lobby state
+    /// Returns an error if game is not in lobby state or the nickname is
+    /// already used by another player (case-insensitive)
     pub fn add_player(&mut self, nickname: String) -> Result<Player, String> {
         if self.state != GameState::Lobby {
             return Err("Cannot join game that has already started".to_string());
         }
 
+        if !self.nicknames.insert(nickname.to_lowercase()) {
+            return Err("Nickname already taken".to_string());
+        }
+
         let is_host = self.players.is_empty(); // First player is host
         let player = Player::new(nickname, is_host);
         self.players.insert(player.id.clone(), player.clone());
@@ -120,7 +224,9 @@ impl GameSession {
     ///
     /// * `player_id` - ID of the player to remove
     pub fn remove_player(&mut self, player_id: &str) {
-        self.players.remove(player_id);
+        if let Some(player) = self.players.remove(player_id) {
+            self.nicknames.remove(&player.nickname.to_lowercase());
+        }
 
         // If host left, assign new host
         if !self.players.is_empty() && !self.players.values().any(|p| p.is_host) {
@@ -130,6 +236,30 @@ impl GameSession {
         }
     }
 
+    /// Check if a nickname is already used by a player in this game
+    ///
+    /// # Arguments
+    ///
+    /// * `nickname` - The nickname to check (case-insensitive)
+    ///
+    /// # Returns
+    ///
+    /// True if another player already has this nickname
+    pub fn is_nickname_taken(&self, nickname: &str) -> bool {
+        self.nicknames.contains(&nickname.to_lowercase())
+    }
+
+    /// Get the Dragon player
+    ///
+    /// # Returns
+    ///
+    /// The Dragon, or None if roles have not been assigned yet
+    pub fn dragon(&self) -> Option<&Player> {
+        self.dragon_id
+            .as_deref()
+            .and_then(|id| self.players.get(id))
+    }
+
     /// Check if the game can be started
     ///
     /// # Returns
@@ -196,22 +326,19 @@ impl GameSession {
             return Err("Game has already started".to_string());
         }
 
-        // Assign roles
-        let mut players_list: Vec<Player> = self.players.values().cloned().collect();
-        assign_roles(&mut players_list)?;
-
-        // Update players with assigned roles
-        for player in players_list {
-            self.players.insert(player.id.clone(), player);
-        }
+        // Assign roles in place, then remember the Dragon
+        assign_roles(self.players.values_mut())?;
+        self.dragon_id = self
+            .players
+            .values()
+            .find(|p| p.role.as_deref() == Some(Role::Dragon.as_str()))
+            .map(|p| p.id.clone());
 
         // Select random word pair
         let mut rng = thread_rng();
-        let word_pair = WORD_PAIRS
-            .choose(&mut rng)
-            .ok_or("No word pairs available")?;
-        self.villager_word = Some(word_pair.0.to_string());
-        self.knight_word = Some(word_pair.1.to_string());
+        let (villager_word, knight_word) = random_word_pair(&mut rng);
+        self.villager_word = Some(villager_word.to_string());
+        self.knight_word = Some(knight_word.to_string());
 
         // Shuffle and store player order for turn-based word saying
         let mut player_ids: Vec<String> = self.players.keys().cloned().collect();
@@ -318,33 +445,24 @@ impl GameSession {
     ///
     /// "villagers", "dragon", or None if game continues
     pub fn check_win_condition(&self) -> Option<String> {
-        let alive_players: Vec<&Player> = self.players.values().filter(|p| p.is_alive).collect();
-        let dragon = self
-            .players
-            .values()
-            .find(|p| p.role.as_deref() == Some("dragon"));
+        let dragon = self.dragon()?;
 
         // Dragon was eliminated
-        if let Some(d) = dragon {
-            if !d.is_alive {
-                // Give dragon a chance to guess the word
-                return None; // Will transition to DRAGON_GUESS state
-            }
+        if !dragon.is_alive {
+            // Give dragon a chance to guess the word
+            return None; // Will transition to DRAGON_GUESS state
         }
 
         // Only 2 players left and Dragon is alive
-        if alive_players.len() <= 2 {
-            if let Some(d) = dragon {
-                if d.is_alive {
-                    return Some("dragon".to_string());
-                }
-            }
+        let alive_count = self.players.values().filter(|p| p.is_alive).count();
+        if alive_count <= 2 {
+            return Some("dragon".to_string());
         }
 
         None // Game continues
     }
 
-    /// Get game state customized for a specific player
+    /// Get a borrowed view of the game state customized for a specific player
     ///
     /// # Arguments
     ///
@@ -352,58 +470,64 @@ impl GameSession {
     ///
     /// # Returns
     ///
-    /// JSON value with game state
-    pub fn get_state_for_player(&self, player_id: &str) -> serde_json::Value {
-        let player = match self.players.get(player_id) {
-            Some(p) => p,
-            None => return serde_json::json!({}),
-        };
-
-        let alive_count = self.players.values().filter(|p| p.is_alive).count();
+    /// The player's view of the game, or None if the player is not in this game
+    pub fn state_view(&self, player_id: &str) -> Option<PlayerStateView<'_>> {
+        let player = self.players.get(player_id)?;
+        let is_finished = self.state == GameState::Finished;
 
         // Determine which word to show based on role
         let your_word = if player.knows_word {
             match player.role.as_deref() {
-                Some("knight") => self.knight_word.clone(),
-                _ => self.villager_word.clone(), // Villager
+                Some("knight") => self.knight_word.as_deref(),
+                _ => self.villager_word.as_deref(), // Villager
             }
         } else {
             None
         };
 
-        let mut state_data = serde_json::json!({
-            "game_id": self.game_id,
-            "state": self.state,
-            "your_id": player_id,
-            "your_role": player.role,
-            "your_word": your_word,
-            "is_host": player.is_host,
-            "is_alive": player.is_alive,
-            "players": self.players.values().map(|p| p.to_dict(false)).collect::<Vec<_>>(),
-            "player_count": self.players.len(),
-            "alive_count": alive_count,
-            "can_start": self.can_start(),
-            "votes_submitted": self.votes.len(),
-            "has_voted": self.votes.contains_key(player_id),
-            "last_elimination": self.last_elimination,
-            "player_order": self.player_order,
-            "voting_timer_seconds": self.voting_timer_seconds,
-            "voting_started_at": self.voting_started_at.map(|t| t.unix_timestamp()),
-        });
-
-        if self.state == GameState::Finished {
-            state_data["winner"] = serde_json::json!(self.winner);
-            state_data["villager_word"] = serde_json::json!(self.villager_word);
-            state_data["knight_word"] = serde_json::json!(self.knight_word);
-            state_data["dragon_guess"] = serde_json::json!(self.dragon_guess);
-            state_data["players"] = serde_json::json!(self
-                .players
-                .values()
-                .map(|p| p.to_dict(true))
-                .collect::<Vec<_>>());
-        }
+        Some(PlayerStateView {
+            game_id: &self.game_id,
+            state: self.state,
+            your_id: &player.id,
+            your_role: player.role.as_deref(),
+            your_word,
+            is_host: player.is_host,
+            is_alive: player.is_alive,
+            players: PlayerList {
+                players: &self.players,
+                include_role: is_finished,
+            },
+            player_count: self.players.len(),
+            alive_count: self.players.values().filter(|p| p.is_alive).count(),
+            can_start: self.can_start(),
+            votes_submitted: self.votes.len(),
+            has_voted: self.votes.contains_key(player_id),
+            last_elimination: self.last_elimination.as_ref(),
+            player_order: &self.player_order,
+            voting_timer_seconds: self.voting_timer_seconds,
+            voting_started_at: self.voting_started_at.map(|t| t.unix_timestamp()),
+            results: is_finished.then_some(ResultsView {
+                winner: self.winner.as_deref(),
+                villager_word: self.villager_word.as_deref(),
+                knight_word: self.knight_word.as_deref(),
+                dragon_guess: self.dragon_guess.as_deref(),
+            }),
+        })
+    }
 
-        state_data
+    /// Get game state customized for a specific player
+    ///
+    /// # Arguments
+    ///
+    /// * `player_id` - ID of the player to get state for
+    ///
+    /// # Returns
+    ///
+    /// JSON value with game state
+    pub fn get_state_for_player(&self, player_id: &str) -> serde_json::Value {
+        self.state_view(player_id)
+            .and_then(|view| serde_json::to_value(view).ok())
+            .unwrap_or_else(|| serde_json::json!({}))
     }
 
     /// Broadcast current game state to all connected players
@@ -418,15 +542,11 @@ impl GameSession {
         );
 
         for player_id in self.players.keys() {
-            let state = self.get_state_for_player(player_id);
-            let message = serde_json::json!({
-                "type": "state_update",
-                "data": state
-            });
+            let message = self.state_view(player_id).map(|view| view.to_message());
 
-            if let Ok(msg_str) = serde_json::to_string(&message) {
+            if let Some(Ok(msg_str)) = message {
                 // Send to broadcast channel (ignore errors if no receivers)
-                let _ = self.broadcast_tx.send(msg_str);
+                let _ = self.broadcast_tx.send(msg_str.into());
             }
         }
     }
@@ -447,6 +567,19 @@ mod tests {
         assert!(game.knight_word.is_none());
     }
 
+    #[test]
+    fn test_game_state_as_str_matches_serde() {
+        for state in [
+            GameState::Lobby,
+            GameState::Playing,
+            GameState::Voting,
+            GameState::DragonGuess,
+            GameState::Finished,
+        ] {
+            assert_eq!(serde_json::to_value(state).unwrap(), state.as_str());
+        }
+    }
+
     #[test]
     fn test_add_player() {
         let mut game = GameSession::new("test-123".to_string());
@@ -527,6 +660,10 @@ mod tests {
         assert!(game.started_at.is_some());
         assert_eq!(game.player_order.len(), 3);
 
+        // Dragon is cached for win-condition checks
+        let dragon = game.dragon().unwrap();
+        assert_eq!(dragon.role.as_deref(), Some("dragon"));
+
         // All players should have roles assigned
         for player in game.players.values() {
             assert!(player.role.is_some());
@@ -566,4 +703,83 @@ mod tests {
         // Player2 should become host
         assert!(game.players.get(&player2.id).unwrap().is_host);
     }
+
+    #[test]
+    fn test_state_view_message() {
+        let mut game = GameSession::new("test-123".to_string());
+
+        let alice = game.add_player("Alice".to_string()).unwrap();
+        game.add_player("Bob".to_string()).unwrap();
+
+        let message = game.state_view(&alice.id).unwrap().to_message().unwrap();
+        let parsed: serde_json::Value = serde_json::from_str(&message).unwrap();
+
+        assert_eq!(parsed["type"], "state_update");
+        assert_eq!(parsed["data"]["game_id"], "test-123");
+        assert_eq!(parsed["data"]["state"], "lobby");
+        assert_eq!(parsed["data"]["your_id"], alice.id.as_str());
+        assert_eq!(parsed["data"]["players"].as_array().unwrap().len(), 2);
+        assert!(parsed["data"]["players"][0].get("role").is_none());
+        assert!(parsed["data"].get("winner").is_none());
+    }
+
+    #[test]
+    fn test_get_state_for_player_finished_reveals_results() {
+        let mut game = GameSession::new("test-123".to_string());
+
+        let alice = game.add_player("Alice".to_string()).unwrap();
+        game.add_player("Bob".to_string()).unwrap();
+        game.add_player("Charlie".to_string()).unwrap();
+        game.start_game().unwrap();
+
+        game.state = GameState::Finished;
+        game.winner = Some("villagers".to_string());
+
+        let state = game.get_state_for_player(&alice.id);
+
+        assert_eq!(state["winner"], "villagers");
+        assert!(state["villager_word"].is_string());
+        assert!(state["dragon_guess"].is_null());
+        assert!(state["players"][0]["role"].is_string());
+    }
+
+    #[test]
+    fn test_get_state_for_unknown_player() {
+        let game = GameSession::new("test-123".to_string());
+
+        assert!(game.state_view("nobody").is_none());
+        assert_eq!(game.get_state_for_player("nobody"), serde_json::json!({}));
+    }
+
+    #[test]
+    fn test_is_nickname_taken() {
+        let mut game = GameSession::new("test-123".to_string());
+
+        let alice = game.add_player("Alice".to_string()).unwrap();
+
+        assert!(game.is_nickname_taken("Alice"));
+        assert!(game.is_nickname_taken("aLiCe"));
+        assert!(!game.is_nickname_taken("Bob"));
+
+        // Nickname becomes available again once the player leaves
+        game.remove_player(&alice.id);
+        assert!(!game.is_nickname_taken("Alice"));
+    }
+
+    #[test]
+    fn test_add_player_rejects_duplicate_nickname() {
+        let mut game = GameSession::new("test-123".to_string());
+
+        let alice = game.add_player("Alice".to_string()).unwrap();
+        assert_eq!(
+            game.add_player("ALICE".to_string()).unwrap_err(),
+            "Nickname already taken"
+        );
+        assert_eq!(game.players.len(), 1);
+
+        // The rejected join must not free the name held by the first player
+        assert!(game.is_nickname_taken("Alice"));
+        game.remove_player(&alice.id);
+        assert!(game.add_player("alice".to_string()).is_ok());
+    }
 }
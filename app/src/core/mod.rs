@@ -7,5 +7,5 @@ pub mod roles;
 pub use constants::*;
 pub use game_manager::GameManager;
 pub use game_session::{GameSession, GameState};
-pub use player::Player;
+pub use player::{Player, PublicPlayer};
 pub use roles::{assign_roles, Role};
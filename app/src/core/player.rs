@@ -21,6 +21,18 @@ pub struct Player {
     pub joined_at: OffsetDateTime,
 }
 
+/// Borrowed public view of a player, serialized directly into API responses
+#[derive(Debug, Clone, Copy, Serialize)]
+pub struct PublicPlayer<'a> {
+    pub id: &'a str,
+    pub nickname: &'a str,
+    pub is_alive: bool,
+    pub is_host: bool,
+    /// Present (possibly null) only when roles are revealed
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub role: Option<Option<&'a str>>,
+}
+
 impl Player {
     /// Create a new player
     ///
@@ -34,7 +46,11 @@ impl Player {
     /// A new Player instance with a unique ID
     pub fn new(nickname: String, is_host: bool) -> Self {
         Self {
-            id: Uuid::new_v4().to_string(),
+            // Hyphen-free hex, encoded into a stack buffer instead of going through Display
+            id: Uuid::new_v4()
+                .simple()
+                .encode_lower(&mut Uuid::encode_buffer())
+                .to_owned(),
             nickname,
             role: None,
             is_alive: true,
@@ -44,6 +60,25 @@ impl Player {
         }
     }
 
+    /// Get a borrowed public view of the player for API responses
+    ///
+    /// # Arguments
+    ///
+    /// * `include_role` - Whether to include the player's role (only for game end)
+    ///
+    /// # Returns
+    ///
+    /// View that serializes the player's public fields without copying them
+    pub fn public_view(&self, include_role: bool) -> PublicPlayer<'_> {
+        PublicPlayer {
+            id: &self.id,
+            nickname: &self.nickname,
+            is_alive: self.is_alive,
+            is_host: self.is_host,
+            role: include_role.then_some(self.role.as_deref()),
+        }
+    }
+
     /// Convert player to dictionary for API responses
     ///
     /// # Arguments
@@ -54,22 +89,7 @@ impl Player {
     ///
     /// JSON value representation of the player
     pub fn to_dict(&self, include_role: bool) -> serde_json::Value {
-        if include_role {
-            serde_json::json!({
-                "id": self.id,
-                "nickname": self.nickname,
-                "is_alive": self.is_alive,
-                "is_host": self.is_host,
-                "role": self.role,
-            })
-        } else {
-            serde_json::json!({
-                "id": self.id,
-                "nickname": self.nickname,
-                "is_alive": self.is_alive,
-                "is_host": self.is_host,
-            })
-        }
+        serde_json::to_value(self.public_view(include_role)).unwrap_or_default()
     }
 }
 
@@ -89,6 +109,18 @@ mod tests {
         assert!(!player.id.is_empty());
     }
 
+    #[test]
+    fn test_player_id_format() {
+        let player = Player::new("Test".to_string(), false);
+
+        // 128-bit ID as 32 lowercase hex characters
+        assert_eq!(player.id.len(), 32);
+        assert!(player
+            .id
+            .chars()
+            .all(|c| c.is_ascii_digit() || ('a'..='f').contains(&c)));
+    }
+
     #[test]
     fn test_new_host_player() {
         let player = Player::new("Host".to_string(), true);
@@ -116,4 +148,21 @@ mod tests {
 
         assert_eq!(dict["role"], "villager");
     }
+
+    #[test]
+    fn test_public_view_serialization() {
+        let mut player = Player::new("Test".to_string(), true);
+
+        let hidden = serde_json::to_value(player.public_view(false)).unwrap();
+        assert_eq!(hidden["id"], player.id.as_str());
+        assert!(hidden.get("role").is_none());
+
+        // Unassigned role is still revealed as null
+        let revealed = serde_json::to_value(player.public_view(true)).unwrap();
+        assert!(revealed["role"].is_null());
+        assert!(revealed.get("role").is_some());
+
+        player.role = Some("dragon".to_string());
+        assert_eq!(player.to_dict(true)["role"], "dragon");
+    }
 }
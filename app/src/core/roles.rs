@@ -2,8 +2,9 @@ use rand::seq::SliceRandom;
 use rand::thread_rng;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::iter;
 
-use super::Player;
+use super::{Player, MAX_PLAYERS, MIN_PLAYERS};
 
 /// Player roles in the game
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
@@ -16,25 +17,37 @@ pub enum Role {
 
 impl Role {
     /// Get the string representation of the role
-    pub fn as_str(&self) -> &'static str {
+    pub const fn as_str(&self) -> &'static str {
         match self {
             Role::Villager => "villager",
             Role::Knight => "knight",
             Role::Dragon => "dragon",
         }
     }
+
+    /// Whether players with this role are given a word (everyone except the Dragon)
+    pub fn knows_word(&self) -> bool {
+        !matches!(self, Role::Dragon)
+    }
 }
 
-/// Calculate role distribution based on player count
-///
-/// Always 1 Dragon, rest split between Villagers and Knights.
-///
-/// Distribution:
-/// - 3-4 players: 1 Dragon, 2-3 Villagers, 0 Knights
-/// - 5-6 players: 1 Dragon, 3-4 Villagers, 1 Knight
-/// - 7-8 players: 1 Dragon, 4-5 Villagers, 2 Knights
-/// - 9-10 players: 1 Dragon, 5-6 Villagers, 3 Knights
-/// - 11-12 players: 1 Dragon, 6-7 Villagers, 4 Knights
+/// Role counts as (dragons, knights, villagers), indexed by `player_count - MIN_PLAYERS`
+const ROLE_COUNTS: [(usize, usize, usize); MAX_PLAYERS - MIN_PLAYERS + 1] = role_count_table();
+
+/// Build the role count table at compile time
+const fn role_count_table() -> [(usize, usize, usize); MAX_PLAYERS - MIN_PLAYERS + 1] {
+    let mut table = [(0, 0, 0); MAX_PLAYERS - MIN_PLAYERS + 1];
+    let mut i = 0;
+    while i < table.len() {
+        let player_count = MIN_PLAYERS + i;
+        let knights = (player_count - 3) / 2;
+        table[i] = (1, knights, player_count - 1 - knights);
+        i += 1;
+    }
+    table
+}
+
+/// Look up role counts for a player count
 ///
 /// # Arguments
 ///
@@ -42,26 +55,20 @@ impl Role {
 ///
 /// # Returns
 ///
-/// HashMap mapping Role to count
+/// Tuple of (dragons, knights, villagers)
 ///
 /// # Errors
 ///
 /// Returns an error if player count is out of valid range (3-12)
-pub fn calculate_role_distribution(player_count: usize) -> Result<HashMap<Role, usize>, String> {
-    if player_count < 3 {
+fn role_counts(player_count: usize) -> Result<(usize, usize, usize), String> {
+    if player_count < MIN_PLAYERS {
         return Err("Minimum 3 players required".to_string());
     }
-    if player_count > 12 {
+    if player_count > MAX_PLAYERS {
         return Err("Maximum 12 players allowed".to_string());
     }
 
-    let dragons = 1;
-    let knights = if player_count >= 3 {
-        (player_count - 3) / 2
-    } else {
-        0
-    };
-    let villagers = player_count - dragons - knights;
+    let (dragons, knights, villagers) = ROLE_COUNTS[player_count - MIN_PLAYERS];
 
     tracing::debug!(
         "Role distribution for {} players: {} dragon, {} knights, {} villagers",
@@ -71,6 +78,34 @@ pub fn calculate_role_distribution(player_count: usize) -> Result<HashMap<Role,
         villagers
     );
 
+    Ok((dragons, knights, villagers))
+}
+
+/// Calculate role distribution based on player count
+///
+/// Always 1 Dragon, rest split between Villagers and Knights.
+///
+/// Distribution:
+/// - 3-4 players: 1 Dragon, 2-3 Villagers, 0 Knights
+/// - 5-6 players: 1 Dragon, 3-4 Villagers, 1 Knight
+/// - 7-8 players: 1 Dragon, 4-5 Villagers, 2 Knights
+/// - 9-10 players: 1 Dragon, 5-6 Villagers, 3 Knights
+/// - 11-12 players: 1 Dragon, 6-7 Villagers, 4 Knights
+///
+/// # Arguments
+///
+/// * `player_count` - Number of players in the game
+///
+/// # Returns
+///
+/// HashMap mapping Role to count
+///
+/// # Errors
+///
+/// Returns an error if player count is out of valid range (3-12)
+pub fn calculate_role_distribution(player_count: usize) -> Result<HashMap<Role, usize>, String> {
+    let (dragons, knights, villagers) = role_counts(player_count)?;
+
     let mut distribution = HashMap::new();
     distribution.insert(Role::Dragon, dragons);
     distribution.insert(Role::Knight, knights);
@@ -85,68 +120,36 @@ pub fn calculate_role_distribution(player_count: usize) -> Result<HashMap<Role,
 ///
 /// # Arguments
 ///
-/// * `players` - Mutable slice of Player objects to assign roles to
+/// * `players` - Mutable references to the Player objects to assign roles to
 ///
 /// # Errors
 ///
 /// Returns an error if player count is out of valid range
-pub fn assign_roles(players: &mut [Player]) -> Result<(), String> {
+pub fn assign_roles<'a, I>(players: I) -> Result<(), String>
+where
+    I: IntoIterator<Item = &'a mut Player>,
+    I::IntoIter: ExactSizeIterator,
+{
+    let players = players.into_iter();
     let player_count = players.len();
 
-    // Validate player count
-    if player_count < 3 {
-        return Err("Minimum 3 players required".to_string());
-    }
-    if player_count > 12 {
-        return Err("Maximum 12 players allowed".to_string());
-    }
-
-    // Calculate role counts
-    let dragons = 1;
-    let knights = (player_count - 3) / 2;
-    let villagers = player_count - dragons - knights;
-
-    tracing::debug!(
-        "Role distribution for {} players: {} dragon, {} knights, {} villagers",
-        player_count,
-        dragons,
-        knights,
-        villagers
-    );
-
-    // Build role pool array directly with correct proportions
-    let mut role_pool = Vec::with_capacity(player_count);
+    // Look up role counts
+    let (_, knights, villagers) = role_counts(player_count)?;
 
-    // Add 1 dragon
-    role_pool.push(Role::Dragon);
-
-    // Add knights
-    for _ in 0..knights {
-        role_pool.push(Role::Knight);
-    }
-
-    // Add villagers
-    for _ in 0..villagers {
-        role_pool.push(Role::Villager);
-    }
+    // Build role pool with correct proportions in a single exact-size allocation
+    let mut role_pool: Vec<Role> = iter::once(Role::Dragon)
+        .chain(iter::repeat(Role::Knight).take(knights))
+        .chain(iter::repeat(Role::Villager).take(villagers))
+        .collect();
 
     // Shuffle the role pool
     let mut rng = thread_rng();
     role_pool.shuffle(&mut rng);
 
-    // Sanity check
-    if role_pool.len() != player_count {
-        return Err(format!(
-            "Role pool size {} does not match player count {}",
-            role_pool.len(),
-            player_count
-        ));
-    }
-
     // Assign roles to players
-    for (player, role) in players.iter_mut().zip(role_pool.iter()) {
+    for (player, role) in players.zip(role_pool) {
         player.role = Some(role.as_str().to_string());
-        player.knows_word = *role != Role::Dragon;
+        player.knows_word = role.knows_word();
         tracing::debug!(
             "Assigned role {} to player {}",
             role.as_str(),
@@ -266,18 +269,13 @@ mod tests {
         let result = assign_roles(&mut players);
         assert!(result.is_ok());
 
-        // Check that roles are assigned
-        for player in &players {
-            assert!(player.role.is_some());
-        }
-
-        // Count roles
+        // Check every player got a role and count them in a single pass
         let mut dragon_count = 0;
         let mut knight_count = 0;
         let mut villager_count = 0;
 
         for player in &players {
-            match player.role.as_ref().unwrap().as_str() {
+            match player.role.as_deref().expect("Role should be assigned") {
                 "dragon" => {
                     dragon_count += 1;
                     assert!(!player.knows_word);
@@ -305,4 +303,11 @@ mod tests {
         assert_eq!(Role::Knight.as_str(), "knight");
         assert_eq!(Role::Dragon.as_str(), "dragon");
     }
+
+    #[test]
+    fn test_role_knows_word() {
+        assert!(Role::Villager.knows_word());
+        assert!(Role::Knight.knows_word());
+        assert!(!Role::Dragon.knows_word());
+    }
 }
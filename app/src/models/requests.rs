@@ -164,6 +164,13 @@ mod tests {
         assert!(JoinGameRequest::validate_nickname("Charlie#").is_err());
     }
 
+    #[test]
+    fn test_validate_nickname_unicode() {
+        assert_eq!(JoinGameRequest::validate_nickname("José").unwrap(), "José");
+        assert!(JoinGameRequest::validate_nickname("José!").is_err());
+        assert!(JoinGameRequest::validate_nickname("Zoë\u{2603}").is_err());
+    }
+
     #[test]
     fn test_join_game_request_new() {
         let request = JoinGameRequest::new("Alice".to_string()).unwrap();
@@ -1,6 +1,6 @@
 use askama::Template;
 use axum::{
-    extract::{Path, Query, State},
+    extract::{FromRequest, Path, Query, Request, State},
     http::{HeaderMap, StatusCode},
     response::IntoResponse,
     Form,
@@ -53,7 +53,7 @@ pub async fn show_index() -> impl IntoResponse {
 /// JSON response with HX-Redirect header to join page
 pub async fn create_game(State(state): State<AppState>) -> impl IntoResponse {
     let mut manager = state.game_manager.write().await;
-    let game_id = manager.create_game();
+    let game_id = manager.create_scheduled_game(&state.game_manager);
 
     // Create response with HX-Redirect header for HTMX
     let mut headers = HeaderMap::new();
@@ -111,23 +111,45 @@ pub struct JoinForm {
 /// # Arguments
 ///
 /// * `game_id` - The game session ID from path
-/// * `form` - Form data with nickname
 /// * `state` - Shared application state
 /// * `jar` - Cookie jar for setting auth cookie
+/// * `request` - Request whose body holds the form data with nickname
 ///
 /// # Returns
 ///
 /// JSON response with HX-Redirect header and authentication cookie
+///
+/// The form body is only read once the game is known to exist and be in the
+/// lobby, so requests for unknown games are rejected without parsing it.
 pub async fn join_game(
     Path(game_id): Path<String>,
     State(state): State<AppState>,
     jar: CookieJar,
-    Form(form): Form<JoinForm>,
+    request: Request,
 ) -> Result<impl IntoResponse, (StatusCode, String)> {
+    {
+        let manager = state.game_manager.read().await;
+        let game = manager
+            .get_game(&game_id)
+            .ok_or((StatusCode::NOT_FOUND, "Game not found".to_string()))?;
+
+        if game.state != GameState::Lobby {
+            return Err((
+                StatusCode::BAD_REQUEST,
+                "Game has already started".to_string(),
+            ));
+        }
+    }
+
+    let Form(form) = Form::<JoinForm>::from_request(request, &state)
+        .await
+        .map_err(|e| (e.status(), e.body_text()))?;
+
     // Validate nickname
     let validated_request =
         JoinGameRequest::new(form.nickname).map_err(|e| (StatusCode::BAD_REQUEST, e))?;
 
+    // Re-check under the write lock, the game may have changed meanwhile
     let mut manager = state.game_manager.write().await;
     let game = manager
         .get_game_mut(&game_id)
@@ -140,19 +162,7 @@ pub async fn join_game(
         ));
     }
 
-    // Check for duplicate nicknames
-    if game
-        .players
-        .values()
-        .any(|p| p.nickname.to_lowercase() == validated_request.nickname.to_lowercase())
-    {
-        return Err((
-            StatusCode::BAD_REQUEST,
-            "Nickname already taken".to_string(),
-        ));
-    }
-
-    // Add player
+    // Add player (rejects duplicate nicknames)
     let player = game
         .add_player(validated_request.nickname)
         .map_err(|e| (StatusCode::BAD_REQUEST, e))?;
@@ -187,7 +197,7 @@ pub async fn join_game(
         "event": "player_joined"
     });
     if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-        let _ = game.broadcast_tx.send(msg_text);
+        let _ = game.broadcast_tx.send(msg_text.into());
     }
 
     // Create response with HX-Redirect header
@@ -278,11 +288,7 @@ pub async fn play_again(
     }
 
     // Check for duplicate nicknames in rematch game
-    if rematch_game
-        .players
-        .values()
-        .any(|p| p.nickname.to_lowercase() == nickname.to_lowercase())
-    {
+    if rematch_game.is_nickname_taken(&nickname) {
         return Err((
             StatusCode::BAD_REQUEST,
             "Nickname already taken in rematch game".to_string(),
@@ -322,7 +328,7 @@ pub async fn play_again(
         "event": "player_joined"
     });
     if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-        let _ = rematch_game.broadcast_tx.send(msg_text);
+        let _ = rematch_game.broadcast_tx.send(msg_text.into());
     }
 
     // Create response with HX-Redirect header to rematch lobby
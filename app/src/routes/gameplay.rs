@@ -58,7 +58,7 @@ pub struct CurrentPlayer {
 
 /// Game state for template
 pub struct GameStateInfo {
-    pub value: String,
+    pub value: &'static str,
     pub is_playing: bool,
     pub is_voting: bool,
     pub is_dragon_guess: bool,
@@ -184,7 +184,7 @@ pub async fn show_game(
         player_id: query.player_id.clone(),
         word,
         state: GameStateInfo {
-            value: format!("{:?}", game.state).to_lowercase(),
+            value: game.state.as_str(),
             is_playing,
             is_voting,
             is_dragon_guess,
@@ -277,7 +277,7 @@ pub async fn start_voting(
     });
     if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
         tracing::debug!("Broadcasting voting_started trigger: {}", msg_text);
-        match game.broadcast_tx.send(msg_text) {
+        match game.broadcast_tx.send(msg_text.into()) {
             Ok(receiver_count) => tracing::debug!("Broadcast sent to {} receivers", receiver_count),
             Err(e) => tracing::warn!("Broadcast failed: {:?}", e),
         }
@@ -351,7 +351,7 @@ pub async fn get_timer(
                     "event": "timer_expired"
                 });
                 if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-                    let _ = game.broadcast_tx.send(msg_text);
+                    let _ = game.broadcast_tx.send(msg_text.into());
                 }
             }
         }
@@ -446,14 +446,17 @@ pub async fn submit_vote(
         }
 
         // Store game state before potentially dropping the borrow
-        let game_state_before_rematch = game.state.clone();
+        let game_state_before_rematch = game.state;
 
         // Create rematch game if game is finished
         if game_state_before_rematch == GameState::Finished {
             // Drop game borrow to create rematch
             let _ = game;
 
-            let rematch_game_id = manager.create_game();
+            // Finished games use a shorter TTL
+            manager.schedule_expiry(&state.game_manager, &game_id);
+
+            let rematch_game_id = manager.create_scheduled_game(&state.game_manager);
 
             // Get game again to set rematch_game_id
             let game = manager
@@ -468,7 +471,7 @@ pub async fn submit_vote(
                 "event": "voting_complete"
             });
             if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-                let send_result = game.broadcast_tx.send(msg_text);
+                let send_result = game.broadcast_tx.send(msg_text.into());
                 tracing::info!(
                     "Broadcast voting_complete: receivers={}, state={:?}",
                     send_result.unwrap_or(0),
@@ -493,7 +496,7 @@ pub async fn submit_vote(
             "event": "voting_complete"
         });
         if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-            let send_result = game.broadcast_tx.send(msg_text);
+            let send_result = game.broadcast_tx.send(msg_text.into());
             tracing::info!(
                 "Broadcast voting_complete: receivers={}, state={:?}",
                 send_result.unwrap_or(0),
@@ -518,7 +521,7 @@ pub async fn submit_vote(
         "event": "vote_submitted"
     });
     if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-        let _ = game.broadcast_tx.send(msg_text);
+        let _ = game.broadcast_tx.send(msg_text.into());
     }
 
     let alive_count = game.players.values().filter(|p| p.is_alive).count();
@@ -614,7 +617,10 @@ pub async fn guess_word(
     // Drop game borrow to create rematch
     let _ = game;
 
-    let rematch_game_id = manager.create_game();
+    // Finished games use a shorter TTL
+    manager.schedule_expiry(&state.game_manager, &game_id);
+
+    let rematch_game_id = manager.create_scheduled_game(&state.game_manager);
 
     // Get game again to set rematch_game_id
     let game = manager
@@ -629,7 +635,7 @@ pub async fn guess_word(
         "event": "dragon_guessed"
     });
     if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-        let _ = game.broadcast_tx.send(msg_text);
+        let _ = game.broadcast_tx.send(msg_text.into());
     }
 
     // Redirect to results page
@@ -171,7 +171,7 @@ pub async fn start_game(
         "event": "game_started"
     });
     if let Ok(msg_text) = serde_json::to_string(&broadcast_msg) {
-        let _ = game.broadcast_tx.send(msg_text);
+        let _ = game.broadcast_tx.send(msg_text.into());
     }
 
     // Create response with HX-Redirect header
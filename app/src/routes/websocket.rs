@@ -8,9 +8,23 @@ use axum::{
 };
 use axum_extra::extract::CookieJar;
 use futures::{SinkExt, StreamExt};
+use serde::Deserialize;
+use std::borrow::Cow;
+use std::sync::Arc;
+use tokio::sync::broadcast::error::RecvError;
 
 use crate::{auth::token::verify_player_token, state::AppState};
 
+/// Routing fields of a message received from the game's broadcast channel
+///
+/// `kind` borrows from the message unless it contains escapes. Every other
+/// field (including `event`) is skipped, so its shape can't reject the message.
+#[derive(Deserialize)]
+struct BroadcastEnvelope<'a> {
+    #[serde(rename = "type", borrow)]
+    kind: Cow<'a, str>,
+}
+
 /// WebSocket endpoint for real-time game updates
 ///
 /// # Arguments
@@ -78,8 +92,10 @@ pub async fn websocket_handler(
     // Get broadcast receiver before dropping the read lock
     let broadcast_rx = game.broadcast_tx.subscribe();
 
-    // Get initial state
-    let initial_state = game.get_state_for_player(&player_id);
+    // Serialize initial state while the game is borrowed
+    let initial_message = game
+        .state_view(&player_id)
+        .and_then(|view| view.to_message().ok());
 
     drop(manager); // Release read lock
 
@@ -91,7 +107,7 @@ pub async fn websocket_handler(
             socket,
             game_id,
             player_id,
-            initial_state,
+            initial_message,
             broadcast_rx,
             state,
         )
@@ -105,26 +121,21 @@ pub async fn websocket_handler(
 /// * `socket` - The WebSocket connection
 /// * `game_id` - The game session ID
 /// * `player_id` - The player's ID
-/// * `initial_state` - Initial game state to send
+/// * `initial_message` - Serialized initial state update to send, if any
 /// * `broadcast_rx` - Broadcast receiver for state updates
 /// * `state` - Shared application state for fetching fresh game state
 async fn handle_socket(
     socket: WebSocket,
     game_id: String,
     player_id: String,
-    initial_state: serde_json::Value,
-    mut broadcast_rx: tokio::sync::broadcast::Receiver<String>,
+    initial_message: Option<String>,
+    mut broadcast_rx: tokio::sync::broadcast::Receiver<Arc<str>>,
     state: AppState,
 ) {
     let (mut sender, mut receiver) = socket.split();
 
     // Send initial state
-    let initial_message = serde_json::json!({
-        "type": "state_update",
-        "data": initial_state
-    });
-
-    if let Ok(msg_text) = serde_json::to_string(&initial_message) {
+    if let Some(msg_text) = initial_message {
         if sender.send(Message::Text(msg_text)).await.is_ok() {
             tracing::debug!("Sent initial state to player={}", player_id);
         }
@@ -137,60 +148,79 @@ async fn handle_socket(
     let mut send_task = tokio::spawn(async move {
         // Listen for broadcast updates
         loop {
-            match broadcast_rx.recv().await {
+            let resync = match broadcast_rx.recv().await {
                 Ok(broadcast_msg) => {
-                    // Parse the broadcast message to check if it's an update trigger
-                    if let Ok(msg_json) = serde_json::from_str::<serde_json::Value>(&broadcast_msg)
-                    {
-                        if msg_json["type"] == "update_trigger" {
-                            tracing::info!(
-                                "Player {} processing update_trigger: event={:?}",
-                                player_id_clone,
-                                msg_json["event"]
-                            );
-                            // Fetch fresh personalized state for this player
-                            let manager = state_clone.game_manager.read().await;
-                            if let Some(game) = manager.get_game(&game_id_clone) {
-                                let player_state = game.get_state_for_player(&player_id_clone);
-                                tracing::info!(
-                                    "Sending state to player {}: state={}, role={:?}, is_alive={}",
-                                    player_id_clone,
-                                    player_state
-                                        .get("state")
-                                        .and_then(|v| v.as_str())
-                                        .unwrap_or("unknown"),
-                                    player_state.get("your_role"),
-                                    player_state
-                                        .get("is_alive")
-                                        .and_then(|v| v.as_bool())
-                                        .unwrap_or(false)
-                                );
-                                let state_msg = serde_json::json!({
-                                    "type": "state_update",
-                                    "data": player_state
-                                });
-                                if let Ok(msg_text) = serde_json::to_string(&state_msg) {
-                                    if sender.send(Message::Text(msg_text)).await.is_err() {
-                                        tracing::warn!(
-                                            "Failed to send state to player={}",
-                                            player_id_clone
-                                        );
-                                        break;
-                                    }
-                                }
-                            }
-                        } else {
-                            // Forward other message types directly
-                            if sender.send(Message::Text(broadcast_msg)).await.is_err() {
-                                break;
-                            }
+                    // Only the envelope is needed to route the message
+                    let Ok(envelope) = serde_json::from_str::<BroadcastEnvelope>(&broadcast_msg)
+                    else {
+                        continue;
+                    };
+
+                    if envelope.kind == "update_trigger" {
+                        tracing::info!(
+                            "Player {} processing update_trigger: {}",
+                            player_id_clone,
+                            broadcast_msg
+                        );
+                        true
+                    } else {
+                        // Forward other message types directly
+                        if sender
+                            .send(Message::Text(broadcast_msg.to_string()))
+                            .await
+                            .is_err()
+                        {
+                            break;
                         }
+                        false
                     }
                 }
-                Err(_) => {
+                Err(RecvError::Lagged(skipped)) => {
+                    // A slow client fell behind the channel; a fresh state snapshot
+                    // supersedes whatever it missed, so resync instead of disconnecting
+                    tracing::warn!(
+                        "Player {} lagged {} broadcast messages, resyncing",
+                        player_id_clone,
+                        skipped
+                    );
+                    true
+                }
+                Err(RecvError::Closed) => {
                     tracing::debug!("Broadcast channel closed for player={}", player_id_clone);
                     break;
                 }
+            };
+
+            if !resync {
+                continue;
+            }
+
+            // Fetch fresh personalized state for this player, releasing
+            // the read lock before the socket write so a slow client
+            // can't hold up game mutations
+            let msg_text = {
+                let manager = state_clone.game_manager.read().await;
+                let Some(game) = manager.get_game(&game_id_clone) else {
+                    continue;
+                };
+                let Some(view) = game.state_view(&player_id_clone) else {
+                    continue;
+                };
+                tracing::info!(
+                    "Sending state to player {}: state={:?}, role={:?}, is_alive={}",
+                    player_id_clone,
+                    view.state,
+                    view.your_role,
+                    view.is_alive
+                );
+                view.to_message()
+            };
+
+            if let Ok(msg_text) = msg_text {
+                if sender.send(Message::Text(msg_text)).await.is_err() {
+                    tracing::warn!("Failed to send state to player={}", player_id_clone);
+                    break;
+                }
             }
         }
     });
@@ -278,4 +308,20 @@ mod tests {
         assert_eq!(message["type"], "state_update");
         assert_eq!(message["data"]["game_id"], "test");
     }
+
+    #[test]
+    fn test_broadcast_envelope_parsing() {
+        let trigger = r#"{"type":"update_trigger","event":"player_joined"}"#;
+        let envelope: super::BroadcastEnvelope = serde_json::from_str(trigger).unwrap();
+        assert_eq!(envelope.kind, "update_trigger");
+
+        let other = r#"{"type":"state_update","data":{}}"#;
+        let envelope: super::BroadcastEnvelope = serde_json::from_str(other).unwrap();
+        assert_eq!(envelope.kind, "state_update");
+
+        // Escaped strings and non-string events must still parse
+        let escaped = r#"{"type":"update\u005ftrigger","event":{"name":"vote"}}"#;
+        let envelope: super::BroadcastEnvelope = serde_json::from_str(escaped).unwrap();
+        assert_eq!(envelope.kind, "update_trigger");
+    }
 }
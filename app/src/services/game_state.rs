@@ -156,11 +156,8 @@ mod tests {
         game.start_game().unwrap();
 
         // Kill all but one player
-        let player_ids: Vec<String> = game.players.keys().cloned().collect();
-        for player_id in player_ids.iter().take(player_ids.len() - 1) {
-            if let Some(player) = game.players.get_mut(player_id) {
-                player.is_alive = false;
-            }
+        for player in game.players.values_mut().skip(1) {
+            player.is_alive = false;
         }
 
         let (can, err) = can_start_voting(&game);
@@ -196,9 +193,9 @@ mod tests {
         game.start_game().unwrap();
 
         // Add some votes first
-        let player_ids: Vec<String> = game.players.keys().cloned().collect();
-        game.votes
-            .insert(player_ids[0].clone(), player_ids[1].clone());
+        let mut player_ids = game.players.keys().cloned();
+        let (voter, target) = (player_ids.next().unwrap(), player_ids.next().unwrap());
+        game.votes.insert(voter, target);
 
         transition_to_voting(&mut game);
 
@@ -41,8 +41,13 @@ pub fn can_vote(game: &GameSession, player_id: &str) -> (bool, Option<String>) {
 ///
 /// True if all alive players have submitted votes
 pub fn all_votes_submitted(game: &GameSession) -> bool {
-    let alive_count = game.players.values().filter(|p| p.is_alive).count();
-    game.votes.len() >= alive_count
+    // Only need to know whether there are more alive players than votes, so stop
+    // scanning as soon as one more alive player than votes has been seen
+    game.players
+        .values()
+        .filter(|p| p.is_alive)
+        .nth(game.votes.len())
+        .is_none()
 }
 
 #[cfg(test)]
@@ -59,57 +64,61 @@ mod tests {
         player.id.clone()
     }
 
-    #[test]
-    fn test_can_vote_not_in_voting_phase() {
-        let game = create_test_game();
-        let (can, err) = can_vote(&game, "player1");
-
-        assert!(!can);
-        assert_eq!(err, Some("Not in voting phase".to_string()));
+    fn add_test_players(game: &mut GameSession, nicknames: &[&str]) -> Vec<String> {
+        nicknames
+            .iter()
+            .map(|nickname| add_test_player(game, nickname))
+            .collect()
     }
 
-    #[test]
-    fn test_can_vote_player_not_found() {
-        let mut game = create_test_game();
-        game.state = GameState::Voting;
-
-        let (can, err) = can_vote(&game, "nonexistent");
-
-        assert!(!can);
-        assert_eq!(err, Some("Player not found".to_string()));
+    /// Each voter votes for the next one, wrapping around
+    fn complete_vote_map(voters: &[String]) -> impl Iterator<Item = (String, String)> + '_ {
+        voters
+            .iter()
+            .zip(voters.iter().cycle().skip(1))
+            .map(|(voter, target)| (voter.clone(), target.clone()))
     }
 
     #[test]
-    fn test_can_vote_dead_player() {
-        let mut game = create_test_game();
-        let player_id = add_test_player(&mut game, "Alice");
-
-        // Mark player as dead
-        if let Some(player) = game.players.get_mut(&player_id) {
-            player.is_alive = false;
+    fn test_can_vote_rejections() {
+        // Each case tweaks a voting game (or the voter ID) to hit one rejection
+        type Setup = fn(&mut GameSession, &mut String);
+        let cases: [(Setup, &str); 4] = [
+            (
+                |game, _| game.state = GameState::Lobby,
+                "Not in voting phase",
+            ),
+            (
+                |_, player_id| *player_id = "nonexistent".to_string(),
+                "Player not found",
+            ),
+            (
+                |game, player_id| {
+                    if let Some(player) = game.players.get_mut(player_id.as_str()) {
+                        player.is_alive = false;
+                    }
+                },
+                "Dead players cannot vote",
+            ),
+            (
+                |game, player_id| {
+                    game.votes.insert(player_id.clone(), player_id.clone());
+                },
+                "Already voted",
+            ),
+        ];
+
+        for (setup, expected) in cases {
+            let mut game = create_test_game();
+            let mut player_id = add_test_player(&mut game, "Alice");
+            game.state = GameState::Voting;
+
+            setup(&mut game, &mut player_id);
+            let (can, err) = can_vote(&game, &player_id);
+
+            assert!(!can, "Expected rejection: {}", expected);
+            assert_eq!(err.as_deref(), Some(expected));
         }
-
-        game.state = GameState::Voting;
-
-        let (can, err) = can_vote(&game, &player_id);
-
-        assert!(!can);
-        assert_eq!(err, Some("Dead players cannot vote".to_string()));
-    }
-
-    #[test]
-    fn test_can_vote_already_voted() {
-        let mut game = create_test_game();
-        let player_id = add_test_player(&mut game, "Alice");
-        let target_id = add_test_player(&mut game, "Bob");
-
-        game.state = GameState::Voting;
-        game.votes.insert(player_id.clone(), target_id);
-
-        let (can, err) = can_vote(&game, &player_id);
-
-        assert!(!can);
-        assert_eq!(err, Some("Already voted".to_string()));
     }
 
     #[test]
@@ -128,8 +137,7 @@ mod tests {
     #[test]
     fn test_all_votes_submitted_no_votes() {
         let mut game = create_test_game();
-        add_test_player(&mut game, "Alice");
-        add_test_player(&mut game, "Bob");
+        add_test_players(&mut game, &["Alice", "Bob"]);
 
         assert!(!all_votes_submitted(&game));
     }
@@ -137,11 +145,9 @@ mod tests {
     #[test]
     fn test_all_votes_submitted_partial() {
         let mut game = create_test_game();
-        let player1 = add_test_player(&mut game, "Alice");
-        let player2 = add_test_player(&mut game, "Bob");
-        add_test_player(&mut game, "Charlie");
+        let ids = add_test_players(&mut game, &["Alice", "Bob", "Charlie"]);
 
-        game.votes.insert(player1, player2);
+        game.votes.insert(ids[0].clone(), ids[1].clone());
 
         assert!(!all_votes_submitted(&game));
     }
@@ -149,13 +155,9 @@ mod tests {
     #[test]
     fn test_all_votes_submitted_complete() {
         let mut game = create_test_game();
-        let player1 = add_test_player(&mut game, "Alice");
-        let player2 = add_test_player(&mut game, "Bob");
-        let player3 = add_test_player(&mut game, "Charlie");
+        let ids = add_test_players(&mut game, &["Alice", "Bob", "Charlie"]);
 
-        game.votes.insert(player1.clone(), player2.clone());
-        game.votes.insert(player2.clone(), player3.clone());
-        game.votes.insert(player3.clone(), player1.clone());
+        game.votes.extend(complete_vote_map(&ids));
 
         assert!(all_votes_submitted(&game));
     }
@@ -163,18 +165,15 @@ mod tests {
     #[test]
     fn test_all_votes_submitted_with_dead_players() {
         let mut game = create_test_game();
-        let player1 = add_test_player(&mut game, "Alice");
-        let player2 = add_test_player(&mut game, "Bob");
-        let player3 = add_test_player(&mut game, "Charlie");
+        let ids = add_test_players(&mut game, &["Alice", "Bob", "Charlie"]);
 
-        // Mark player3 as dead
-        if let Some(player) = game.players.get_mut(&player3) {
+        // Mark the third player as dead
+        if let Some(player) = game.players.get_mut(&ids[2]) {
             player.is_alive = false;
         }
 
         // Only 2 alive players, need 2 votes
-        game.votes.insert(player1.clone(), player2.clone());
-        game.votes.insert(player2.clone(), player1.clone());
+        game.votes.extend(complete_vote_map(&ids[..2]));
 
         assert!(all_votes_submitted(&game));
     }
@@ -10,10 +10,7 @@ use crate::core::game_session::GameSession;
 ///
 /// True if dragon is not alive
 pub fn check_dragon_eliminated(game: &GameSession) -> bool {
-    game.players
-        .values()
-        .find(|p| p.role.as_deref() == Some("dragon"))
-        .is_some_and(|dragon| !dragon.is_alive)
+    game.dragon().is_some_and(|dragon| !dragon.is_alive)
 }
 
 /// Check if dragon has survived to win condition
@@ -26,14 +23,9 @@ pub fn check_dragon_eliminated(game: &GameSession) -> bool {
 ///
 /// True if dragon is alive and only 2 or fewer players remain
 pub fn check_dragon_survived(game: &GameSession) -> bool {
-    let alive_players: Vec<_> = game.players.values().filter(|p| p.is_alive).collect();
-
-    let dragon = game
-        .players
-        .values()
-        .find(|p| p.role.as_deref() == Some("dragon"));
-
-    dragon.is_some_and(|d| d.is_alive && alive_players.len() <= 2)
+    game.dragon().is_some_and(|dragon| {
+        dragon.is_alive && game.players.values().filter(|p| p.is_alive).count() <= 2
+    })
 }
 
 /// Determine the winner of the game
@@ -61,7 +53,9 @@ pub fn determine_winner(game: &GameSession) -> Option<String> {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use crate::core::game_session::GameSession;
+    use crate::core::{game_session::GameSession, Role};
+
+    const DRAGON: &str = Role::Dragon.as_str();
 
     fn create_test_game_with_roles() -> GameSession {
         let mut game = GameSession::new("test_game".to_string());
@@ -78,97 +72,85 @@ mod tests {
         game
     }
 
-    #[test]
-    fn test_check_dragon_eliminated_false() {
-        let game = create_test_game_with_roles();
-
-        // Dragon should be alive initially
-        assert!(!check_dragon_eliminated(&game));
+    /// ID of the Dragon assigned by start_game
+    fn dragon_id(game: &GameSession) -> String {
+        game.dragon().map(|p| p.id.clone()).unwrap()
     }
 
-    #[test]
-    fn test_check_dragon_eliminated_true() {
-        let mut game = create_test_game_with_roles();
-
-        // Find and kill the dragon
-        let dragon_id = game
-            .players
-            .iter()
-            .find(|(_, p)| p.role.as_deref() == Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .unwrap();
+    /// IDs of every player who isn't the Dragon
+    fn non_dragon_ids(game: &GameSession) -> Vec<String> {
+        game.players
+            .values()
+            .filter(|p| p.role.as_deref() != Some(DRAGON))
+            .map(|p| p.id.clone())
+            .collect()
+    }
 
-        if let Some(dragon) = game.players.get_mut(&dragon_id) {
-            dragon.is_alive = false;
+    /// Mark exactly the given players alive and everyone else dead
+    fn set_alive(game: &mut GameSession, alive_ids: &[String]) {
+        for player in game.players.values_mut() {
+            player.is_alive = alive_ids.contains(&player.id);
         }
-
-        assert!(check_dragon_eliminated(&game));
     }
 
     #[test]
-    fn test_check_dragon_survived_false_too_many_players() {
+    fn test_check_dragon_eliminated_false() {
         let game = create_test_game_with_roles();
 
-        // 5 players alive, should be false
-        assert!(!check_dragon_survived(&game));
+        // Dragon should be alive initially
+        assert!(!check_dragon_eliminated(&game));
     }
 
     #[test]
-    fn test_check_dragon_survived_false_dragon_dead() {
+    fn test_check_dragon_eliminated_true() {
         let mut game = create_test_game_with_roles();
 
-        // Kill the dragon
-        let dragon_id = game
-            .players
-            .iter()
-            .find(|(_, p)| p.role.as_deref() == Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .unwrap();
-
-        if let Some(dragon) = game.players.get_mut(&dragon_id) {
-            dragon.is_alive = false;
-        }
+        // Kill only the dragon
+        let others = non_dragon_ids(&game);
+        set_alive(&mut game, &others);
 
-        // Kill other players until only 2 remain
-        let mut non_dragon_players: Vec<String> = game
-            .players
-            .iter()
-            .filter(|(_, p)| p.role.as_deref() != Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .collect();
-
-        // Kill 3 non-dragon players (leaving 2 total: 1 dead dragon + 1 alive other)
-        for _ in 0..3 {
-            if let Some(player_id) = non_dragon_players.pop() {
-                if let Some(player) = game.players.get_mut(&player_id) {
-                    player.is_alive = false;
-                }
-            }
-        }
-
-        assert!(!check_dragon_survived(&game));
+        assert!(check_dragon_eliminated(&game));
     }
 
     #[test]
-    fn test_check_dragon_survived_true() {
-        let mut game = create_test_game_with_roles();
-
-        // Find non-dragon players and kill enough to get to 2 alive
-        let non_dragon_players: Vec<String> = game
-            .players
-            .iter()
-            .filter(|(_, p)| p.role.as_deref() != Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .collect();
-
-        // Kill 3 players to get down to 2 alive (dragon + 1 other)
-        for player_id in non_dragon_players.iter().take(3) {
-            if let Some(player) = game.players.get_mut(player_id) {
-                player.is_alive = false;
+    fn test_check_dragon_survived() {
+        // (dragon alive, non-dragons alive, expected)
+        let cases = [
+            (true, 4, false),  // All 5 players alive
+            (true, 2, false),  // 3 players alive
+            (false, 1, false), // Dragon dead, 1 other alive
+            (true, 1, true),   // Dragon and 1 other alive
+            (true, 0, true),   // Only the dragon alive
+        ];
+
+        for (dragon_alive, others_alive, expected) in cases {
+            let mut game = create_test_game_with_roles();
+
+            let mut alive = non_dragon_ids(&game);
+            alive.truncate(others_alive);
+            if dragon_alive {
+                alive.push(dragon_id(&game));
             }
+            set_alive(&mut game, &alive);
+
+            assert_eq!(
+                check_dragon_survived(&game),
+                expected,
+                "dragon_alive={}, others_alive={}",
+                dragon_alive,
+                others_alive
+            );
+
+            // A surviving dragon wins outright, otherwise play continues
+            // (a dead dragon still gets to guess the word)
+            assert_eq!(
+                determine_winner(&game),
+                expected.then(|| "dragon".to_string()),
+                "dragon_alive={}, others_alive={}",
+                dragon_alive,
+                others_alive
+            );
         }
-
-        assert!(check_dragon_survived(&game));
     }
 
     #[test]
@@ -183,63 +165,11 @@ mod tests {
     fn test_determine_winner_dragon_eliminated() {
         let mut game = create_test_game_with_roles();
 
-        // Find and kill the dragon
-        let dragon_id = game
-            .players
-            .iter()
-            .find(|(_, p)| p.role.as_deref() == Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .unwrap();
-
-        if let Some(dragon) = game.players.get_mut(&dragon_id) {
-            dragon.is_alive = false;
-        }
+        // Kill only the dragon
+        let others = non_dragon_ids(&game);
+        set_alive(&mut game, &others);
 
         // Should return None to allow dragon guess
         assert_eq!(determine_winner(&game), None);
     }
-
-    #[test]
-    fn test_determine_winner_dragon_survived() {
-        let mut game = create_test_game_with_roles();
-
-        // Find non-dragon players and kill enough to get to 2 alive
-        let non_dragon_players: Vec<String> = game
-            .players
-            .iter()
-            .filter(|(_, p)| p.role.as_deref() != Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .collect();
-
-        // Kill 3 players to get down to 2 alive
-        for player_id in non_dragon_players.iter().take(3) {
-            if let Some(player) = game.players.get_mut(player_id) {
-                player.is_alive = false;
-            }
-        }
-
-        assert_eq!(determine_winner(&game), Some("dragon".to_string()));
-    }
-
-    #[test]
-    fn test_determine_winner_exactly_2_players_dragon_alive() {
-        let mut game = create_test_game_with_roles();
-
-        // Kill all but 2 players (one being the dragon)
-        let non_dragon_players: Vec<String> = game
-            .players
-            .iter()
-            .filter(|(_, p)| p.role.as_deref() != Some("dragon"))
-            .map(|(id, _)| id.clone())
-            .collect();
-
-        // Kill all but 1 non-dragon player
-        for player_id in non_dragon_players.iter().take(non_dragon_players.len() - 1) {
-            if let Some(player) = game.players.get_mut(player_id) {
-                player.is_alive = false;
-            }
-        }
-
-        assert_eq!(determine_winner(&game), Some("dragon".to_string()));
-    }
 }
@@ -155,8 +155,25 @@ mod route_registration_tests {
     async fn test_join_game_route_exists() {
         let server = create_test_server();
 
+        // Unknown games are rejected with 404 before the body is read,
+        // so a real game is needed to tell the route exists
+        let create_response = server.post("/api/games/create").await;
+
+        // If rate limited, skip this test
+        if create_response.status_code() == StatusCode::TOO_MANY_REQUESTS {
+            println!("Skipping test due to rate limiting");
+            return;
+        }
+
+        let body = create_response.text();
+        let game_id = body
+            .split("game_id\":\"")
+            .nth(1)
+            .and_then(|s| s.split('\"').next())
+            .expect("Should have game_id in response");
+
         // POST /api/games/:game_id/join should exist
-        let response = server.post("/api/games/test123/join").await;
+        let response = server.post(&format!("/api/games/{}/join", game_id)).await;
 
         assert_ne!(
             response.status_code(),
@@ -165,13 +182,29 @@ mod route_registration_tests {
         );
     }
 
+    #[tokio::test]
+    async fn test_join_unknown_game_rejected_before_body() {
+        let server = create_test_server();
+
+        // No form body: the missing game must be reported, not the body
+        let response = server.post("/api/games/test123/join").await;
+
+        if response.status_code() == StatusCode::TOO_MANY_REQUESTS {
+            println!("Skipping test due to rate limiting");
+            return;
+        }
+
+        assert_eq!(response.status_code(), StatusCode::NOT_FOUND);
+        assert_eq!(response.text(), "Game not found");
+    }
+
     #[tokio::test]
     async fn test_all_api_routes_registered() {
         let server = create_test_server();
 
+        // Join 404s for unknown games, see test_join_game_route_exists
         let routes = vec![
             ("POST", "/api/games/create"),
-            ("POST", "/api/games/test123/join"),
             ("POST", "/api/games/test123/start"),
             ("POST", "/api/games/test123/set-timer"),
             ("POST", "/api/games/test123/start-voting"),